@@ -6,11 +6,24 @@ With these classes, bot makers will not have to implement the UCI or XBoard inte
 
 from __future__ import annotations
 import chess
+import chess.polyglot
 from chess.engine import PlayResult, Limit
 import random
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
 from engine_wrapper import MinimalEngine, MOVE
-from typing import Any
+from typing import Any, Optional
 import logging
+import numpy as np
+import numpy.typing as npt
+import os
+import time
+
+try:
+    from numba import njit  # type: ignore[import-not-found]
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
 
 
 # Use this logger variable to print messages to the console or log files.
@@ -22,7 +35,23 @@ logger = logging.getLogger(__name__)
 class ExampleEngine(MinimalEngine):
     """An example engine that all homemade engines inherit."""
 
-    pass
+    __slots__ = ()
+
+
+def _random_legal_move(board: chess.Board) -> chess.Move:
+    """
+    Pick a uniformly random legal move in one pass over the generator.
+
+    Reservoir sampling keeps a single candidate and replaces it with probability 1/n,
+    so the legal moves never have to be materialized into a list.
+    """
+    chosen: Optional[chess.Move] = None
+    for count, move in enumerate(board.legal_moves, start=1):
+        if random.random() < 1 / count:
+            chosen = move
+    if chosen is None:
+        raise ValueError("No legal moves to choose from.")
+    return chosen
 
 
 # Strategy names and ideas from tom7's excellent eloWorld video
@@ -30,29 +59,32 @@ class ExampleEngine(MinimalEngine):
 class RandomMove(ExampleEngine):
     """Get a random move."""
 
+    __slots__ = ()
+
     def search(self, board: chess.Board, *args: Any) -> PlayResult:
         """Choose a random move."""
-        return PlayResult(random.choice(list(board.legal_moves)), None)
+        return PlayResult(_random_legal_move(board), None)
 
 
 class Alphabetical(ExampleEngine):
     """Get the first move when sorted by san representation."""
 
+    __slots__ = ()
+
     def search(self, board: chess.Board, *args: Any) -> PlayResult:
         """Choose the first move alphabetically."""
-        moves = list(board.legal_moves)
-        moves.sort(key=board.san)
-        return PlayResult(moves[0], None)
+        return PlayResult(min(board.legal_moves, key=board.san), None)
 
 
 class FirstMove(ExampleEngine):
     """Get the first move when sorted by uci representation."""
 
+    __slots__ = ()
+
     def search(self, board: chess.Board, *args: Any) -> PlayResult:
         """Choose the first move alphabetically in uci representation."""
-        moves = list(board.legal_moves)
-        moves.sort(key=str)
-        return PlayResult(moves[0], None)
+        # The first move of the sorted list is just the minimum, so skip the list and the sort.
+        return PlayResult(min(board.legal_moves, key=chess.Move.uci), None)
 
 
 class ComboEngine(ExampleEngine):
@@ -62,6 +94,8 @@ class ComboEngine(ExampleEngine):
     This engine demonstrates how one can use `time_limit`, `draw_offered`, and `root_moves`.
     """
 
+    __slots__ = ()
+
     def search(self, board: chess.Board, time_limit: Limit, ponder: bool, draw_offered: bool, root_moves: MOVE) -> PlayResult:
         """
         Choose a move using multiple different methods.
@@ -83,13 +117,530 @@ class ComboEngine(ExampleEngine):
             my_time = time_limit.black_clock if isinstance(time_limit.black_clock, int) else 0
             my_inc = time_limit.black_inc if isinstance(time_limit.black_inc, int) else 0
 
-        possible_moves = root_moves if isinstance(root_moves, list) else list(board.legal_moves)
-
         if my_time / 60 + my_inc > 10:
             # Choose a random move.
-            move = random.choice(possible_moves)
+            move = random.choice(root_moves) if isinstance(root_moves, list) else _random_legal_move(board)
         else:
             # Choose the first move alphabetically in uci representation.
-            possible_moves.sort(key=str)
-            move = possible_moves[0]
+            possible_moves: Iterable[chess.Move] = root_moves if isinstance(root_moves, list) else board.legal_moves
+            move = min(possible_moves, key=chess.Move.uci)
         return PlayResult(move, None, draw_offered=draw_offered)
+
+
+# Piece values and piece-square tables for CompressorEngine, based on Michniewski's
+# simplified evaluation function. The tables are written as seen from White's side of
+# the board (rank 8 first), so a Black piece can use its square directly while a White
+# piece looks up the vertical mirror of its square.
+PIECE_VALUES: dict[chess.PieceType, int] = {chess.PAWN: 100,
+                                            chess.KNIGHT: 320,
+                                            chess.BISHOP: 330,
+                                            chess.ROOK: 500,
+                                            chess.QUEEN: 900,
+                                            chess.KING: 20000}
+
+PSQT: dict[chess.PieceType, list[int]] = {
+    chess.PAWN: [0, 0, 0, 0, 0, 0, 0, 0,
+                 50, 50, 50, 50, 50, 50, 50, 50,
+                 10, 10, 20, 30, 30, 20, 10, 10,
+                 5, 5, 10, 25, 25, 10, 5, 5,
+                 0, 0, 0, 20, 20, 0, 0, 0,
+                 5, -5, -10, 0, 0, -10, -5, 5,
+                 5, 10, 10, -20, -20, 10, 10, 5,
+                 0, 0, 0, 0, 0, 0, 0, 0],
+    chess.KNIGHT: [-50, -40, -30, -30, -30, -30, -40, -50,
+                   -40, -20, 0, 0, 0, 0, -20, -40,
+                   -30, 0, 10, 15, 15, 10, 0, -30,
+                   -30, 5, 15, 20, 20, 15, 5, -30,
+                   -30, 0, 15, 20, 20, 15, 0, -30,
+                   -30, 5, 10, 15, 15, 10, 5, -30,
+                   -40, -20, 0, 5, 5, 0, -20, -40,
+                   -50, -40, -30, -30, -30, -30, -40, -50],
+    chess.BISHOP: [-20, -10, -10, -10, -10, -10, -10, -20,
+                   -10, 0, 0, 0, 0, 0, 0, -10,
+                   -10, 0, 5, 10, 10, 5, 0, -10,
+                   -10, 5, 5, 10, 10, 5, 5, -10,
+                   -10, 0, 10, 10, 10, 10, 0, -10,
+                   -10, 10, 10, 10, 10, 10, 10, -10,
+                   -10, 5, 0, 0, 0, 0, 5, -10,
+                   -20, -10, -10, -10, -10, -10, -10, -20],
+    chess.ROOK: [0, 0, 0, 0, 0, 0, 0, 0,
+                 5, 10, 10, 10, 10, 10, 10, 5,
+                 -5, 0, 0, 0, 0, 0, 0, -5,
+                 -5, 0, 0, 0, 0, 0, 0, -5,
+                 -5, 0, 0, 0, 0, 0, 0, -5,
+                 -5, 0, 0, 0, 0, 0, 0, -5,
+                 -5, 0, 0, 0, 0, 0, 0, -5,
+                 0, 0, 0, 5, 5, 0, 0, 0],
+    chess.QUEEN: [-20, -10, -10, -5, -5, -10, -10, -20,
+                  -10, 0, 0, 0, 0, 0, 0, -10,
+                  -10, 0, 5, 5, 5, 5, 0, -10,
+                  -5, 0, 5, 5, 5, 5, 0, -5,
+                  0, 0, 5, 5, 5, 5, 0, -5,
+                  -10, 5, 5, 5, 5, 5, 0, -10,
+                  -10, 0, 5, 0, 0, 0, 0, -10,
+                  -20, -10, -10, -5, -5, -10, -10, -20],
+    chess.KING: [-30, -40, -40, -50, -50, -40, -40, -30,
+                 -30, -40, -40, -50, -50, -40, -40, -30,
+                 -30, -40, -40, -50, -50, -40, -40, -30,
+                 -30, -40, -40, -50, -50, -40, -40, -30,
+                 -20, -30, -30, -40, -40, -30, -30, -20,
+                 -10, -20, -20, -20, -20, -20, -20, -10,
+                 20, 20, 0, 0, 0, 0, 20, 20,
+                 20, 30, 10, 0, 0, 10, 30, 20]}
+
+# The tables above as each side sees them, with the bare piece value folded in and flattened to one
+# list per color indexed by (piece_type - 1) * 64 + square, so valuing a piece on a square is a single
+# list access. Black reads the visual tables directly; White mirrors vertically.
+PSQT_FLAT_WHITE: list[int] = [PIECE_VALUES[piece_type] + PSQT[piece_type][chess.square_mirror(sq)]
+                              for piece_type in chess.PIECE_TYPES for sq in range(64)]
+PSQT_FLAT_BLACK: list[int] = [PIECE_VALUES[piece_type] + PSQT[piece_type][sq]
+                              for piece_type in chess.PIECE_TYPES for sq in range(64)]
+
+
+def _build_move_psqt(table: list[int]) -> list[list[list[int]]]:
+    """Tabulate, for one side, every (piece, from, to) move's change in piece-square value."""
+    return [[[table[base + to] - table[base + frm] for to in range(64)] for frm in range(64)]
+            for base in range(0, 384, 64)]
+
+
+# The positional part of a move's score depends only on (turn, piece, from, to), so tabulate it once
+# at import (2 * 6 * 64 * 64 entries) and scoring a move's placement becomes a pure index chain.
+MOVE_PSQT: dict[chess.Color, list[list[list[int]]]] = {chess.WHITE: _build_move_psqt(PSQT_FLAT_WHITE),
+                                                       chess.BLACK: _build_move_psqt(PSQT_FLAT_BLACK)}
+
+# The flattened tables again as numpy arrays, for scoring whole move lists in one vectorized pass,
+# plus the bare piece values indexed by piece type (index 0 meaning no piece).
+PSQT_NP: dict[chess.Color, npt.NDArray[np.int64]] = {chess.WHITE: np.array(PSQT_FLAT_WHITE, dtype=np.int64),
+                                                     chess.BLACK: np.array(PSQT_FLAT_BLACK, dtype=np.int64)}
+PIECE_VALUES_NP: npt.NDArray[np.int64] = np.array([0] + [PIECE_VALUES[piece_type] for piece_type in chess.PIECE_TYPES],
+                                                  dtype=np.int64)
+
+# Scoring a move list in numpy only beats the scalar loop once the node is wide enough to amortize
+# the array set-up cost; narrow nodes keep the plain Python path.
+VECTOR_ORDER_MIN_MOVES = 16
+
+# Search bounds. Every score the evaluation can produce stays well inside a C long, so comparisons
+# against these sentinels keep to CPython's fast single-digit int path; mate scores sit far above any
+# material score but far below INF, leaving room to prefer quicker mates.
+INF = 1 << 30
+MATE = 1 << 24
+
+# The deepest iteration CompressorEngine will attempt within its time budget.
+MAX_DEPTH = 6
+
+# Iterations at least this deep fan their root moves out over worker processes; shallower trees
+# finish faster than the cost of shipping work to another process.
+PARALLEL_MIN_DEPTH = 4
+
+# The half-width of the aspiration window around the previous iteration's score.
+ASPIRATION_WINDOW = 50
+
+# Transposition table entries are (depth, value, flag, best move) tuples.
+TT_ENTRY = tuple[int, int, int, Optional[chess.Move]]
+TT_EXACT = 0
+TT_LOWERBOUND = 1
+TT_UPPERBOUND = 2
+
+
+# The hottest functions below (_score_move and _score_board) take their globals as private default
+# arguments: defaults are bound once at definition time, turning every LOAD_GLOBAL dict lookup in the
+# body into a LOAD_FAST frame access.
+def _pawn_attacks(board: chess.Board, color: chess.Color) -> chess.SquareSet:
+    """Get the set of squares attacked by a side's pawns."""
+    # A pawn's attacks depend only on its square, so OR the precomputed masks together instead of
+    # going through board.attacks(), which dispatches on the piece type at every square it is asked about.
+    attack_masks = chess.BB_PAWN_ATTACKS[color]
+    attacked = 0
+    for square in board.pieces(chess.PAWN, color):
+        attacked |= attack_masks[square]
+    return chess.SquareSet(attacked)
+
+
+def _score_move(board: chess.Board, move: chess.Move, from_piece: dict[chess.Square, Optional[chess.Piece]],
+                enemy_pawn_attacks: chess.SquareSet,
+                _move_psqt: dict[chess.Color, list[list[list[int]]]] = MOVE_PSQT,
+                _piece_values: dict[chess.PieceType, int] = PIECE_VALUES) -> int:
+    """Score a move for ordering (positional gain plus an MVV-LVA bonus) using the node's cached lookups."""
+    piece = from_piece[move.from_square]
+    if piece is None:
+        return 0
+    score = _move_psqt[piece.color][piece.piece_type - 1][move.from_square][move.to_square]
+    victim_type = board.piece_type_at(move.to_square)
+    if victim_type is not None:
+        score += 10 * _piece_values[victim_type] - _piece_values[piece.piece_type]
+    if move.to_square in enemy_pawn_attacks:
+        score -= _piece_values[piece.piece_type]
+    return score
+
+
+def _score_moves(board: chess.Board, moves: list[chess.Move]) -> npt.NDArray[np.int64]:
+    """Score a whole move list at once, vectorizing the table lookups of _score_move in numpy."""
+    count = len(moves)
+    frm = np.fromiter((move.from_square for move in moves), dtype=np.int64, count=count)
+    to = np.fromiter((move.to_square for move in moves), dtype=np.int64, count=count)
+    piece_types = np.fromiter((board.piece_type_at(move.from_square) or 0 for move in moves), dtype=np.int64, count=count)
+    victim_types = np.fromiter((board.piece_type_at(move.to_square) or 0 for move in moves), dtype=np.int64, count=count)
+    table = PSQT_NP[board.turn]
+    mover_values = PIECE_VALUES_NP[piece_types]
+    table_index = (piece_types - 1) * 64
+    scores: npt.NDArray[np.int64] = table[table_index + to] - table[table_index + frm]
+    scores = scores + np.where(victim_types > 0, 10 * PIECE_VALUES_NP[victim_types] - mover_values, 0)
+    enemy_pawn_attacks = np.uint64(int(_pawn_attacks(board, not board.turn)))
+    attacked = ((enemy_pawn_attacks >> to.astype(np.uint64)) & np.uint64(1)).astype(bool)
+    scores = scores - np.where(attacked, mover_values, 0)
+    return scores
+
+
+def _ab_kernel_loop(scores: npt.NDArray[np.int64], beta: int) -> tuple[int, int]:
+    """Find the index and value of the best score, stopping early at a beta cutoff."""
+    best_index = 0
+    best = scores[0]
+    for i in range(1, scores.size):
+        if scores[i] > best:
+            best = scores[i]
+            best_index = i
+            if best >= beta:
+                break
+    return (best_index, int(best))
+
+
+def _ab_kernel_scan(scores: npt.NDArray[np.int64], beta: int) -> tuple[int, int]:
+    """Find the index and value of the best score in one vectorized scan."""
+    best_index = int(np.argmax(scores))
+    return (best_index, int(scores[best_index]))
+
+
+# The pure-numeric reduction over a score array is worth JIT-compiling when numba is installed; the
+# numpy scan does the same job (minus the early exit) in one C-level pass otherwise.
+_ab_kernel: Callable[[npt.NDArray[np.int64], int], tuple[int, int]]
+_ab_kernel = njit(cache=True)(_ab_kernel_loop) if HAS_NUMBA else _ab_kernel_scan
+
+
+def _rook_castle_delta(table: list[int], color: chess.Color, kingside: bool) -> int:
+    """Get the table change from the rook's hop when castling."""
+    back_rank_offset = 0 if color == chess.WHITE else 56
+    rook_from, rook_to = (7, 5) if kingside else (0, 3)
+    rook_index = (chess.ROOK - 1) * 64 + back_rank_offset
+    return table[rook_index + rook_to] - table[rook_index + rook_from]
+
+
+def _score_board(board: chess.Board,
+                 _white_table: list[int] = PSQT_FLAT_WHITE, _black_table: list[int] = PSQT_FLAT_BLACK,
+                 _white: chess.Color = chess.WHITE) -> int:
+    """Score a position from White's point of view by summing piece values."""
+    # The flat-table lookup is inlined here: this loop runs for every piece of every evaluated node,
+    # so it is worth skipping a helper call and the global loads inside it.
+    score = 0
+    for square, piece in board.piece_map().items():
+        index = (piece.piece_type - 1) * 64 + square
+        if piece.color == _white:
+            score += _white_table[index]
+        else:
+            score -= _black_table[index]
+    return score
+
+
+def _end_of_game_score(board: chess.Board) -> int:
+    """Score a position with no legal moves (checkmate or a stalemate-like draw) for the side to move."""
+    # Being mated later is slightly better than being mated now, so the search prefers the quickest mate.
+    return -(MATE - len(board.move_stack)) if board.is_checkmate() else 0
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the deadline for the current move has passed."""
+
+    pass
+
+
+class CompressorEngine(ExampleEngine):
+    """A homemade engine running a fixed-depth alpha-beta search over piece-square tables."""
+
+    __slots__ = ("_tt", "_deadline", "_pool", "_nodes")
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Create the engine with an empty transposition table."""
+        super().__init__(*args, **kwargs)
+        self._nodes = 0
+        self._tt: dict[int, TT_ENTRY] = {}
+        self._deadline: Optional[float] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def search(self, board: chess.Board, time_limit: Limit, *args: Any) -> PlayResult:
+        """Choose a move by iteratively deepening the alpha-beta search until the time budget runs out."""
+        deadline = time.monotonic() + self._time_budget(board, time_limit)
+        self._deadline = deadline
+        best_move: Optional[chess.Move] = None
+        score = 0
+        for depth in range(1, MAX_DEPTH + 1):
+            iteration_start = time.monotonic()
+            try:
+                if depth == 1:
+                    move, score = self._ab_search(board, depth)
+                else:
+                    move, score = self._aspiration_search(board, depth, score)
+            except SearchTimeout:
+                break
+            if move is not None:
+                best_move = move
+            # Stop if the budget is used up or the next iteration cannot finish in the remaining time.
+            now = time.monotonic()
+            if now + (now - iteration_start) >= deadline:
+                break
+        logger.debug(f"CompressorEngine score at depth {depth}: {score} after {self._nodes} nodes")
+        if best_move is None:
+            best_move = _random_legal_move(board)
+        return PlayResult(best_move, None)
+
+    def _time_budget(self, board: chess.Board, time_limit: Limit) -> float:
+        """Decide how many seconds to think, from either a fixed move time or the clocks."""
+        if isinstance(time_limit.time, (int, float)):
+            return float(time_limit.time)
+        if board.turn == chess.WHITE:
+            my_time = time_limit.white_clock if isinstance(time_limit.white_clock, (int, float)) else 0.0
+            my_inc = time_limit.white_inc if isinstance(time_limit.white_inc, (int, float)) else 0.0
+        else:
+            my_time = time_limit.black_clock if isinstance(time_limit.black_clock, (int, float)) else 0.0
+            my_inc = time_limit.black_inc if isinstance(time_limit.black_inc, (int, float)) else 0.0
+        return min(my_time / 40 + my_inc, my_time / 2)
+
+    def _aspiration_search(self, board: chess.Board, depth: int, guess: int) -> tuple[Optional[chess.Move], int]:
+        """Search with a narrow window around the previous iteration's score, re-searching wide if it fails."""
+        move, score = self._ab_search(board, depth, guess - ASPIRATION_WINDOW, guess + ASPIRATION_WINDOW)
+        if score <= guess - ASPIRATION_WINDOW or score >= guess + ASPIRATION_WINDOW:
+            move, score = self._ab_search(board, depth)
+        return (move, score)
+
+    def _tt_probe(self, key: int, depth: int, alpha: int, beta: int) -> Optional[tuple[Optional[chess.Move], int]]:
+        """Check the transposition table for an entry that settles the current node."""
+        entry = self._tt.get(key)
+        if entry is None:
+            return None
+        entry_depth, value, flag, move = entry
+        if entry_depth < depth:
+            return None
+        if flag == TT_EXACT:
+            return (move, value)
+        if flag == TT_LOWERBOUND:
+            alpha = max(alpha, value)
+        elif flag == TT_UPPERBOUND:
+            beta = min(beta, value)
+        if alpha >= beta:
+            return (move, value)
+        return None
+
+    def _tt_store(self, key: int, depth: int, value: int, alpha: int, beta: int, move: Optional[chess.Move]) -> None:
+        """Record a search result in the transposition table, always replacing older entries."""
+        if value <= alpha:
+            flag = TT_UPPERBOUND
+        elif value >= beta:
+            flag = TT_LOWERBOUND
+        else:
+            flag = TT_EXACT
+        self._tt[key] = (depth, value, flag, move)
+
+    def _ab_search(self, board: chess.Board, max_depth: int,
+                   alpha: int = -INF, beta: int = INF) -> tuple[Optional[chess.Move], int]:
+        """Run an alpha-beta search over the given window and return the best move with its score for the side to move."""
+        color = 1 if board.turn == chess.WHITE else -1
+        if max_depth >= PARALLEL_MIN_DEPTH and (os.cpu_count() or 1) > 1:
+            return self._parallel_root_search(board, max_depth, alpha, beta, color)
+        return self._recur(max_depth, board, alpha, beta, color)
+
+    def _parallel_root_search(self, board: chess.Board, depth: int, alpha: int, beta: int,
+                              color: int) -> tuple[Optional[chess.Move], int]:
+        """
+        Fan the root moves out over a pool of worker processes.
+
+        The first (likely best) move is searched serially so the workers start with a decent alpha;
+        its score never has to wait on the pool, and the rest of the moves only need to beat it.
+        """
+        legal_moves = list(board.legal_moves)
+        key = chess.polyglot.zobrist_hash(board)
+        if len(legal_moves) < 2:
+            return self._recur(depth, board, alpha, beta, color)
+        alpha_original = alpha
+        moves = self._ordered_moves(board, key, legal_moves)
+        board.push(moves[0])
+        try:
+            _, score = self._recur(depth - 1, board, -beta, -alpha, -color)
+        finally:
+            board.pop()
+        best_move, best_val = moves[0], -score
+        alpha = max(alpha, best_val)
+        if best_val < beta:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+            tasks = [(board.fen(), move.uci(), depth - 1, -beta, -alpha, self._deadline) for move in moves[1:]]
+            for uci, child_score in self._pool.map(_search_child, tasks):
+                if child_score > best_val:
+                    best_val = child_score
+                    best_move = chess.Move.from_uci(uci)
+        self._tt_store(key, depth, best_val, alpha_original, beta, best_move)
+        return (best_move, best_val)
+
+    def _ordered_moves(self, board: chess.Board, key: int, legal_moves: list[chess.Move]) -> list[chess.Move]:
+        """Order the node's moves: the table's best move first, then best _score_move first."""
+        if len(legal_moves) >= VECTOR_ORDER_MIN_MOVES:
+            scores = _score_moves(board, legal_moves)
+            legal_moves = [legal_moves[i] for i in np.argsort(-scores, kind="stable")]
+        else:
+            # The piece and pawn-attack lookups only depend on the position, so compute them once per node.
+            from_piece = {square: board.piece_at(square) for square in {move.from_square for move in legal_moves}}
+            enemy_pawn_attacks = _pawn_attacks(board, not board.turn)
+            legal_moves = sorted(legal_moves, key=lambda m: -_score_move(board, m, from_piece, enemy_pawn_attacks))
+        entry = self._tt.get(key)
+        tt_move = entry[3] if entry is not None else None
+        if tt_move is not None and tt_move in legal_moves:
+            tt_index = legal_moves.index(tt_move)
+            legal_moves[0], legal_moves[tt_index] = legal_moves[tt_index], legal_moves[0]
+        return legal_moves
+
+    def _leaf_layer(self, board: chess.Board, legal_moves: list[chess.Move], key: int, alpha: int, beta: int,
+                    color: int) -> tuple[Optional[chess.Move], int]:
+        """
+        Handle the last ply in one batch: evaluate every child and reduce with the alpha-beta kernel.
+
+        Extracting the numeric compare-and-cutoff loop from the recursion leaves only move generation
+        and evaluation in Python objects, and lets numba JIT the reduction when it is available.
+        """
+        self._nodes += len(legal_moves)
+        evals = self._child_evals(board, legal_moves, color)
+        for i, move in enumerate(legal_moves):
+            # Static scores overrate noisy children (a capture may just be recaptured), so resolve
+            # those with quiescence before the reduction; quiet children keep their batch scores.
+            if board.is_capture(move) or move.promotion is not None:
+                board.push(move)
+                try:
+                    evals[i] = -self._qsearch(board, -beta, -alpha, -color)
+                finally:
+                    board.pop()
+        index, best_val = _ab_kernel(evals, beta)
+        best_move = legal_moves[int(index)]
+        self._tt_store(key, 1, int(best_val), alpha, beta, best_move)
+        return (best_move, int(best_val))
+
+    def _child_evals(self, board: chess.Board, moves: list[chess.Move], color: int) -> npt.NDArray[np.int64]:
+        """
+        Statically evaluate each child position, from the point of view of the side to move.
+
+        A move only changes the evaluation by the mover's table delta, any captured piece, and the
+        rook's hop when castling, so each child is scored as the parent's evaluation plus a handful
+        of lookups instead of push/evaluate/pop (which regenerates board state for every leaf).
+        """
+        base = color * _score_board(board)
+        white = board.turn == chess.WHITE
+        own = PSQT_FLAT_WHITE if white else PSQT_FLAT_BLACK
+        their = PSQT_FLAT_BLACK if white else PSQT_FLAT_WHITE
+        # Hoist the per-move attribute and global lookups out of the loop; bound methods and locals
+        # resolve in one frame access where board.piece_type_at costs a dict lookup every iteration.
+        piece_type_at = board.piece_type_at
+        is_castling = board.is_castling
+        is_en_passant = board.is_en_passant
+        square_file = chess.square_file
+        pawn = chess.PAWN
+        evals = np.empty(len(moves), dtype=np.int64)
+        for i, move in enumerate(moves):
+            piece_type = piece_type_at(move.from_square) or pawn  # legal moves always have a mover
+            final_type = move.promotion or piece_type
+            delta = own[(final_type - 1) * 64 + move.to_square] - own[(piece_type - 1) * 64 + move.from_square]
+            if is_castling(move):
+                delta += _rook_castle_delta(own, board.turn, square_file(move.to_square) > 4)
+            else:
+                victim_square = move.to_square
+                if is_en_passant(move):
+                    victim_square += -8 if white else 8
+                victim_type = piece_type_at(victim_square)
+                if victim_type is not None:
+                    delta += their[(victim_type - 1) * 64 + victim_square]
+            evals[i] = base + delta
+        return evals
+
+    def _out_of_time(self) -> bool:
+        """Check the clock every thousand nodes to see if the search deadline has passed."""
+        return self._deadline is not None and self._nodes % 1000 == 0 and time.monotonic() >= self._deadline
+
+    def _qsearch(self, board: chess.Board, alpha: int, beta: int, color: int) -> int:
+        """
+        Keep searching captures and promotions past the horizon until the position goes quiet.
+
+        The side to move can always decline the noisy moves, so the static evaluation is a
+        stand-pat floor; cutting off the moment it reaches beta keeps these extensions short.
+        """
+        self._nodes += 1
+        if self._out_of_time():
+            raise SearchTimeout
+        stand_pat = color * _score_board(board)
+        if stand_pat >= beta:
+            return stand_pat
+        alpha = max(alpha, stand_pat)
+        best_val = stand_pat
+        for move in board.legal_moves:
+            if not board.is_capture(move) and move.promotion is None:
+                continue
+            board.push(move)
+            try:
+                s = -self._qsearch(board, -beta, -alpha, -color)
+            finally:
+                board.pop()
+            if s > best_val:
+                best_val = s
+                alpha = max(alpha, s)
+                if best_val >= beta:
+                    break
+        return best_val
+
+    def _recur(self, depth: int, board: chess.Board, alpha: int, beta: int, color: int) -> tuple[Optional[chess.Move], int]:
+        """Search a node in negamax form, probing (and filling) the transposition table on the way."""
+        self._nodes += 1
+        if self._out_of_time():
+            raise SearchTimeout
+        if depth == 0:
+            return (None, self._qsearch(board, alpha, beta, color))
+        legal_moves = list(board.legal_moves)
+        if not legal_moves:
+            return (None, _end_of_game_score(board))
+        key = chess.polyglot.zobrist_hash(board)
+        probe = self._tt_probe(key, depth, alpha, beta)
+        if probe is not None:
+            return probe
+        if depth == 1:
+            return self._leaf_layer(board, legal_moves, key, alpha, beta, color)
+        alpha_original = alpha
+        best_move: Optional[chess.Move] = None
+        best_val = -INF
+        for move in self._ordered_moves(board, key, legal_moves):
+            board.push(move)
+            try:
+                _, s = self._recur(depth - 1, board, -beta, -alpha, -color)
+            finally:
+                # Leave the board as it was given even if the search runs out of time mid-node.
+                board.pop()
+            if -s > best_val:
+                best_val = -s
+                best_move = move
+            alpha = max(alpha, best_val)
+            if best_val >= beta:
+                break
+        self._tt_store(key, depth, best_val, alpha_original, beta, best_move)
+        return (best_move, best_val)
+
+
+# Each worker process keeps one private searcher, so its transposition table survives between tasks.
+_worker_searcher: Optional[CompressorEngine] = None
+
+
+def _search_child(args: tuple[str, str, int, int, int, Optional[float]]) -> tuple[str, int]:
+    """Search one root move in a worker process and return its score from the parent's point of view."""
+    global _worker_searcher
+    fen, uci, depth, alpha, beta, deadline = args
+    if _worker_searcher is None:
+        # The workers only run the search core, so the engine-wrapper initialization is skipped.
+        _worker_searcher = CompressorEngine.__new__(CompressorEngine)
+        _worker_searcher._nodes = 0
+        _worker_searcher._tt = {}
+    _worker_searcher._deadline = deadline
+    board = chess.Board(fen)
+    board.push(chess.Move.from_uci(uci))
+    color = 1 if board.turn == chess.WHITE else -1
+    _, score = _worker_searcher._recur(depth, board, alpha, beta, color)
+    return (uci, -score)